@@ -0,0 +1,68 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""Compiled version of the cruise-test inner loop.
+
+Build it in place with
+
+    python setup.py build_ext --inplace
+
+travel.py picks the compiled module up automatically when it is present and
+falls back to the interpreted implementations otherwise.
+"""
+
+import array
+import random
+
+from libc.stdint cimport uint32_t, uint64_t
+
+
+cdef inline uint32_t _rotl(uint32_t x, int k) noexcept nogil:
+    return (x << k) | (x >> (32 - k))
+
+
+cdef inline uint32_t _next(uint32_t* s) noexcept nogil:
+    # xoshiro128++ -- tiny, fast and plenty good for dice rolls.
+    cdef uint32_t result = _rotl(s[0] + s[3], 7) + s[0]
+    cdef uint32_t t = s[1] << 9
+
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = _rotl(s[3], 11)
+    return result
+
+
+cdef inline int _cruise_once(int target_roll, int distance, uint32_t* state) noexcept nogil:
+    cdef int d = distance
+    cdef int pl = 0
+    cdef int roll
+
+    while d > 0:
+        # Rejection-free d100 via a multiply-shift on the top bits; the bias
+        # is far below anything a dice table could ever show.
+        roll = <int>((<uint64_t>_next(state) * 100) >> 32) + 1
+        if roll <= target_roll or roll == 1:
+            d -= 1
+        pl += 1
+    return pl
+
+
+def cruise_tests(int target_roll, int distance, int samples):
+    """Drop-in compiled replacement for travel's roll-by-roll simulation."""
+    cdef uint32_t[4] state
+    cdef int i
+
+    # Seed from the stdlib generator; xoshiro must not start all-zero.
+    for i in range(4):
+        state[i] = random.getrandbits(32) | 1
+
+    out = array.array("i", bytes(4 * samples))
+    cdef int[::1] view = out
+
+    with nogil:
+        for i in range(samples):
+            view[i] = _cruise_once(target_roll, distance, &state[0])
+
+    return out
@@ -0,0 +1,66 @@
+"""The precomputed travel table. Regenerate with generate_table.py."""
+
+TABLE = {(20, 2): [2, 4, 5, 6, 8, 9, 11, 14, 17],
+ (20, 3): [3, 7, 9, 11, 12, 15, 17, 20, 24],
+ (20, 4): [4, 10, 13, 15, 17, 20, 22, 26, 31],
+ (20, 5): [5, 14, 17, 20, 22, 25, 28, 31, 37],
+ (20, 6): [7, 18, 21, 24, 27, 30, 33, 37, 43],
+ (20, 7): [8, 22, 26, 29, 32, 35, 39, 43, 50],
+ (20, 8): [10, 25, 30, 33, 37, 40, 44, 49, 55],
+ (20, 9): [12, 30, 34, 38, 42, 45, 49, 54, 61],
+ (30, 2): [2, 3, 4, 4, 5, 6, 7, 9, 11],
+ (30, 3): [3, 5, 6, 7, 8, 10, 11, 13, 16],
+ (30, 4): [4, 7, 9, 10, 12, 13, 15, 17, 20],
+ (30, 5): [5, 10, 12, 13, 15, 16, 18, 21, 24],
+ (30, 6): [6, 12, 15, 16, 18, 20, 22, 24, 28],
+ (30, 7): [7, 15, 17, 19, 21, 23, 25, 28, 32],
+ (30, 8): [8, 18, 21, 23, 25, 27, 29, 32, 36],
+ (30, 9): [10, 20, 23, 26, 28, 30, 33, 36, 40],
+ (40, 2): [2, 2, 3, 3, 4, 5, 5, 6, 8],
+ (40, 3): [3, 4, 5, 6, 6, 7, 8, 9, 11],
+ (40, 4): [4, 6, 7, 8, 9, 10, 11, 12, 15],
+ (40, 5): [5, 8, 9, 10, 11, 12, 14, 15, 18],
+ (40, 6): [6, 10, 11, 12, 14, 15, 16, 18, 21],
+ (40, 7): [7, 12, 13, 15, 16, 18, 19, 21, 24],
+ (40, 8): [8, 14, 16, 17, 18, 20, 22, 24, 26],
+ (40, 9): [9, 16, 18, 20, 21, 23, 24, 26, 29],
+ (50, 2): [2, 2, 2, 3, 3, 4, 4, 5, 6],
+ (50, 3): [3, 3, 4, 5, 5, 6, 7, 7, 9],
+ (50, 4): [4, 5, 6, 6, 7, 8, 9, 10, 11],
+ (50, 5): [5, 6, 7, 8, 9, 10, 11, 12, 14],
+ (50, 6): [6, 8, 9, 10, 11, 12, 13, 14, 16],
+ (50, 7): [7, 10, 11, 12, 13, 14, 15, 16, 19],
+ (50, 8): [8, 11, 13, 14, 15, 16, 17, 19, 21],
+ (50, 9): [9, 13, 14, 16, 17, 18, 19, 21, 23],
+ (60, 2): [2, 2, 2, 2, 3, 3, 4, 4, 5],
+ (60, 3): [3, 3, 3, 4, 4, 5, 5, 6, 7],
+ (60, 4): [4, 4, 5, 5, 6, 6, 7, 8, 9],
+ (60, 5): [5, 6, 6, 7, 8, 8, 9, 10, 11],
+ (60, 6): [6, 7, 8, 9, 9, 10, 11, 12, 13],
+ (60, 7): [7, 9, 9, 10, 11, 12, 12, 13, 15],
+ (60, 8): [8, 10, 11, 12, 13, 13, 14, 15, 17],
+ (60, 9): [9, 11, 12, 13, 14, 15, 16, 17, 19],
+ (70, 2): [2, 2, 2, 2, 2, 3, 3, 3, 4],
+ (70, 3): [3, 3, 3, 3, 4, 4, 5, 5, 6],
+ (70, 4): [4, 4, 4, 5, 5, 6, 6, 7, 8],
+ (70, 5): [5, 5, 6, 6, 7, 7, 8, 8, 9],
+ (70, 6): [6, 6, 7, 8, 8, 8, 9, 10, 11],
+ (70, 7): [7, 8, 8, 9, 9, 10, 11, 11, 12],
+ (70, 8): [8, 9, 10, 10, 11, 11, 12, 13, 14],
+ (70, 9): [9, 10, 11, 12, 12, 13, 14, 14, 16],
+ (80, 2): [2, 2, 2, 2, 2, 2, 3, 3, 3],
+ (80, 3): [3, 3, 3, 3, 3, 4, 4, 4, 5],
+ (80, 4): [4, 4, 4, 4, 5, 5, 5, 6, 6],
+ (80, 5): [5, 5, 5, 6, 6, 6, 7, 7, 8],
+ (80, 6): [6, 6, 6, 7, 7, 7, 8, 8, 9],
+ (80, 7): [7, 7, 8, 8, 8, 9, 9, 10, 11],
+ (80, 8): [8, 8, 9, 9, 10, 10, 10, 11, 12],
+ (80, 9): [9, 9, 10, 10, 11, 11, 12, 12, 13],
+ (90, 2): [2, 2, 2, 2, 2, 2, 2, 2, 3],
+ (90, 3): [3, 3, 3, 3, 3, 3, 3, 4, 4],
+ (90, 4): [4, 4, 4, 4, 4, 4, 5, 5, 5],
+ (90, 5): [5, 5, 5, 5, 5, 5, 6, 6, 6],
+ (90, 6): [6, 6, 6, 6, 6, 7, 7, 7, 8],
+ (90, 7): [7, 7, 7, 7, 7, 8, 8, 8, 9],
+ (90, 8): [8, 8, 8, 8, 9, 9, 9, 10, 10],
+ (90, 9): [9, 9, 9, 9, 10, 10, 10, 11, 11]}
@@ -0,0 +1,54 @@
+# Copyright 2024 Markus Broecker
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the “Software”), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Regenerates the tables shipped with the tool.
+
+Writes _precomputed.py, which travel.py reads at startup, and table.txt, the
+human-readable copy. Run this whenever you want a fresh set of Monte-Carlo
+variation or after changing the simulation parameters; everyone else just
+runs travel.py and gets the result instantly.
+"""
+
+import contextlib
+import io
+import pprint
+
+import travel
+
+
+def main():
+    table = travel.build_table()
+
+    with open("_precomputed.py", "w") as f:
+        f.write('"""The precomputed travel table. Regenerate with generate_table.py."""\n')
+        f.write("\n")
+        f.write("TABLE = " + pprint.pformat(table) + "\n")
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        travel.print_table(table)
+    with open("table.txt", "w") as f:
+        f.write(out.getvalue())
+
+    print("Wrote _precomputed.py and table.txt.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""Builds the optional compiled cruise-test loop.
+
+Run `python setup.py build_ext --inplace`; needs Cython and a C compiler.
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="space100-travel",
+    ext_modules=cythonize(
+        "_cruise.pyx",
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    ),
+)
@@ -27,9 +27,35 @@ D10 lookup tables that return the total power loss (PL) for this distance
 travelled.
 """
 
-import dataclasses
+from __future__ import annotations
+
+import array
+import bisect
+import itertools
 import math
+import multiprocessing
 import random
+import sys
+import typing
+
+try:
+    import numpy as np
+except ImportError:
+    # The tool stays usable without NumPy, just a lot slower; the functions
+    # below fall back to pure-Python implementations built on array.array,
+    # itertools.accumulate and bisect.
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    # The optional Cython build of the inner loop; see setup.py.
+    import _cruise
+except ImportError:
+    _cruise = None
 
 # The number of Monte-Carlo samples to run per table entry. Higher-values yield
 # statistically better results but is much slower to calculate.
@@ -42,114 +68,216 @@ SKILL_STEP = 10
 MIN_DISTANCE = 2
 MAX_DISTANCE = 10
 
+# A single shared generator; building a fresh PCG64 state per table cell is
+# noticeable next to the small amount of work each cell does.
+_RNG = np.random.default_rng() if np is not None else None
 
-@dataclasses.dataclass
-class Sample:
-    # How many samples were counted.
-    count: int
-    # This sample's percentage of the whole.
-    absolute_percentage: int = 0
-    # How many other samples came before.
-    running_percentage: int = 0
 
+class Histo(typing.NamedTuple):
+    """Histogram columns as parallel arrays, each indexed by PL."""
 
-def cruise_tests(target_roll: int, distance: int) -> list[int]:
-    """Performs successive cruise tests until the ship arrives at the distance.
+    # How many samples were counted per PL.
+    counts: np.ndarray
+    # Each PL's percentage of the whole.
+    abs_pct: np.ndarray
+    # Cumulative percentage up to and including each PL.
+    run_pct: np.ndarray
 
-    target_roll = Int + CM + Pilot skill
-    distance: distance to travel
-    Returns a list of PL /losses/. It will always return /SAMPLES/ results.
-    """
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _cruise_tests_jit(target_roll: int, distance: int, samples: int):
+        # The original roll-by-roll simulation, compiled. Numba keeps one RNG
+        # state per thread, so prange over the samples is contention-free.
+        out = np.empty(samples, np.int32)
+        for i in numba.prange(samples):
+            d = distance
+            pl = 0
+            while d > 0:
+                roll = np.random.randint(1, 101)
+                if roll <= target_roll or roll == 1:
+                    d -= 1
+                pl += 1
+            out[i] = pl
+        return out
+
+
+def _cruise_tests_py(target_roll: int, distance: int, samples: int) -> list[int]:
+    """The original roll-by-roll simulation, for when NumPy is missing."""
     results = []
 
-    for _ in range(0, SAMPLES):
+    # Bind the hot lookups as locals; LOAD_FAST in the inner loop is a lot
+    # cheaper than a global plus attribute lookup per roll.
+    randbytes = random.randbytes
+    append = results.append
+
+    # The loop only needs to know whether a d100 roll succeeds, so pull whole
+    # batches of random bytes at once instead of paying RNG call overhead per
+    # roll. A byte masked to 7 bits is uniform over 0..127; rejecting values
+    # >= 100 leaves a uniform 0..99 roll, and `v < target` matches the old
+    # `roll <= target_roll` with roll = v + 1. Clamping the target keeps the
+    # roll-of-1 auto-success rule intact.
+    threshold = max(target_roll, 1)
+
+    buf = randbytes(4096)
+    pos = 0
+
+    for _ in range(0, samples):
         d = distance
 
         pl = 0
         while d > 0:
-            roll = random.randint(1, 100)
-            if roll <= target_roll or roll == 1:
+            if pos == 4096:
+                buf = randbytes(4096)
+                pos = 0
+            v = buf[pos] & 0x7F
+            pos += 1
+            if v >= 100:
+                continue
+
+            if v < threshold:
                 d -= 1
             pl += 1
 
-        results.append(pl)
-    return sorted(results)
-
-
-def make_histogram(results: list[int]) -> dict[int, Sample]:
-    """Returns a dict of Samples, keyed by PL."""
-    counts = {}
-    for r in results:
-        try:
-            counts[r].count += 1
-        except KeyError:
-            counts[r] = Sample(count=1)
-
-    running_total = 0
-    for k in counts:
-        rel_val = float(counts[k].count) / SAMPLES
-
-        counts[k].absolute_percentage = round(rel_val * 100)
-        running_total += counts[k].absolute_percentage
-        counts[k].running_percentage = running_total
-
-    return counts
-
-
-def resample_into_d9(histo: dict[int, Sample], min_value: int) -> list[int]:
-    """Resamples a histogram into a D9 table."""
-
-    # Invert the histogram, to be keyed by running percentage.
-    pl_by_running_total = {}
-    for k in histo:
-        pl_by_running_total[histo[k].running_percentage] = k
-
-    # The index into the result is found by dividing by 11, yielding 9 results.
-    # We can overwrite the last results, yielding always the highest cost.
-    results = [min_value] * 9
-    for k in pl_by_running_total:
-        idx = math.floor(k / 11)
-        try:
-            results[idx] = pl_by_running_total[k]
-        except IndexError:
-            # This happens when we actually have running totals over 99% ...
-            pass
-
-    # We now have to fill in the 0's in the list by copying over values from the
-    # left until all empty pockets are filled. These 0s can happen when there are
-    # gaps in the results.
-    for i in range(1, 9):
-        if results[i] == min_value:
-            results[i] = results[i - 1]
-
-    for i in range(7, 0, -1):
-        if results[i] == min_value:
-            try:
-                results[i] = results[i + 1]
-            except IndexError as e:
-                raise i
-
-    # Last clean up -- values > 99 are a bit silly. Let's cap those at 99.
-    for i in range(0, 9):
-        results[i] = min(results[i], 99)
-
+        append(pl)
     return results
 
 
-def print_percentages(histo: dict[int, Sample]) -> None:
+def cruise_tests(target_roll: int, distance: int, samples: int = SAMPLES, rng=None):
+    """Performs successive cruise tests until the ship arrives at the distance.
+
+    target_roll = Int + CM + Pilot skill
+    distance: distance to travel
+    samples: how many simulated trips to run.
+    rng: the generator to draw from, defaulting to the shared module one.
+         Ignored by the compiled Cython and Numba kernels, which keep their
+         own state.
+    Returns an array (or list, without NumPy) of PL /losses/, in no
+    particular order. It will always return /samples/ results.
+    """
+    if _cruise is not None:
+        return _cruise.cruise_tests(target_roll, distance, samples)
+    if numba is not None:
+        return _cruise_tests_jit(target_roll, distance, samples)
+    if np is None:
+        return _cruise_tests_py(target_roll, distance, samples)
+    if rng is None:
+        rng = _RNG
+
+    # The rolls needed to score /distance/ successes at chance target_roll/100
+    # follow a Negative Binomial, so one draw per sample replaces simulating
+    # (or even summing) the per-area rolls. negative_binomial() counts the
+    # failures, so the successes are added back on top. A roll of 1 always
+    # succeeds, so the chance never drops below 1%.
+    p = max(target_roll, 1) / 100.0
+
+    return rng.negative_binomial(distance, p, size=samples) + distance
+
+
+def negbinom_cdf(distance: int, p: float, k_max: int = 400) -> np.ndarray:
+    """Exact CDF of the total PL for travelling /distance/ areas.
+
+    The PL is a sum of /distance/ geometric variates, which is Negative
+    Binomial: P(PL=k) = C(k-1, distance-1) * p^distance * (1-p)^(k-distance).
+    """
+    pmf = [0.0] * k_max
+    for k in range(distance, k_max):
+        pmf[k] = (
+            math.comb(k - 1, distance - 1) * p**distance * (1 - p) ** (k - distance)
+        )
+    if np is None:
+        return list(itertools.accumulate(pmf))
+    return np.cumsum(pmf)
+
+
+def exact_d9(target_roll: int, distance: int) -> list[int]:
+    """Computes a cell's D9 analytically, without any sampling.
+
+    Inverts the exact CDF at the 0%, 11%, ..., 88% quantiles, mirroring what
+    resample_into_d9 does to the Monte-Carlo histogram.
+    """
+    p = max(target_roll, 1) / 100.0
+    cdf = negbinom_cdf(distance, p)
+
+    if np is None:
+        return [min(bisect.bisect_right(cdf, i * 11 / 100.0), 99) for i in range(9)]
+
+    qtiles = np.arange(9) * 11 / 100.0
+    pls = np.searchsorted(cdf, qtiles, side="right")
+    return np.minimum(pls, 99).tolist()
+
+
+def make_histogram(results) -> Histo:
+    """Returns the histogram of PL values, as parallel arrays."""
+    total = len(results)
+
+    if np is None:
+        # Packed int32 counts; a[r] += 1 is a C-level update with no dict
+        # hashing and no per-bin Python object.
+        counts = array.array("i", bytes(4 * (max(results) + 1)))
+        for r in results:
+            counts[r] += 1
+
+        # (c * 100 + total // 2) // total rounds like round(c * 100 / total)
+        # for nonnegative counts, without going through floats.
+        half = total // 2
+        abs_pct = array.array("i", ((c * 100 + half) // total for c in counts))
+        run_pct = array.array("i", itertools.accumulate(abs_pct))
+        return Histo(counts=counts, abs_pct=abs_pct, run_pct=run_pct)
+
+    # PL values are small positive ints, so bincount gives us the whole count
+    # array in one pass instead of a per-sample dict update.
+    counts = np.bincount(results)
+    abs_pct = np.rint(counts * 100 / total).astype(int)
+    return Histo(counts=counts, abs_pct=abs_pct, run_pct=np.cumsum(abs_pct))
+
+
+def resample_into_d9(histo: Histo) -> list[int]:
+    """Resamples a histogram into a D9 table.
+
+    Each D9 entry is the PL at one of the quantiles 0%, 11%, ..., 88%, found
+    by one searchsorted over the cumulative counts. This replaces the old
+    invert-then-fill dance, including its gap-filling passes.
+    """
+    # Values > 99 get capped -- they are a bit silly on this table.
+    if np is None:
+        cum = list(itertools.accumulate(histo.counts))
+        qtiles = [i * 11 * cum[-1] // 100 for i in range(9)]
+        return [min(bisect.bisect_right(cum, q), 99) for q in qtiles]
+
+    cum = np.cumsum(histo.counts)
+    qtiles = np.arange(9) * 11 * int(cum[-1]) // 100
+    pls = np.searchsorted(cum, qtiles, side="right")
+    return np.minimum(pls, 99).tolist()
+
+
+def simulate(skill: int, distance: int, samples: int = SAMPLES, rng=None) -> list[int]:
+    """Simulates one (skill, distance) cell and returns its D9.
+
+    This is the one-stop entry point for reusing the simulation outside the
+    CLI, e.g. for other repeated-roll rules; see the README's Hacking section.
+    """
+    results = cruise_tests(skill, distance, samples, rng)
+    return resample_into_d9(make_histogram(results))
+
+
+def print_percentages(histo: Histo) -> None:
     """Calculates percentages and prints a histogram for the result."""
 
-    for k in histo:
-        # Ignore small sample sizes.
-        if histo[k].count < SAMPLES * 0.02:
+    # Ignore small sample sizes, anything below 2%.
+    min_count = sum(histo.counts) // 50
+
+    for k, count in enumerate(histo.counts):
+        if count < min_count:
             continue
 
-        dots = "*" * round(histo[k].absolute_percentage / 10)
+        dots = "*" * ((histo.abs_pct[k] + 5) // 10)
         s = "{0:2d} {1:5d} ({2:2d}% / {3:2d}%) {4:20s}".format(
             k,
-            histo[k].count,
-            histo[k].absolute_percentage,
-            histo[k].running_percentage,
+            histo.counts[k],
+            histo.abs_pct[k],
+            histo.run_pct[k],
             dots,
         )
         print(s)
@@ -159,50 +287,96 @@ def print_table(table: dict[tuple[int, int], list[int]]) -> None:
     """Prints a table of D9s, indexed by skill and distance."""
     print(" Skill                                 Distance")
 
-    ranges = ""
-    for i in range(MIN_DISTANCE, MAX_DISTANCE):
-        ranges += " " * 10 + str(i)
-    print(ranges)
+    print("".join(" " * 10 + str(i) for i in range(MIN_DISTANCE, MAX_DISTANCE)))
 
     for k in range(MIN_SKILL, MAX_SKILL, SKILL_STEP):
         # We need 3 prints for every line, due to D9, as we split it into 3 lines
-        # of 3 entries each.
-        line0 = "      "
-        line1 = " {0:3d}  ".format(k)
-        line2 = "      "
+        # of 3 entries each. Collecting the parts in lists avoids re-allocating
+        # the growing line string on every +=.
+        line0 = ["      "]
+        line1 = [" {0:3d}  ".format(k)]
+        line2 = ["      "]
 
         for d in range(MIN_DISTANCE, MAX_DISTANCE):
             d9 = table[(k, d)]
 
-            def make_table_row(row: int) -> str:
-                assert row >= 0 < 3
-                k = row * 3
-                return "{0:2d} {1:2d} {2:2d}".format(d9[k + 0], d9[k + 1], d9[k + 2])
-
-            line0 += make_table_row(0) + "   "
-            line1 += make_table_row(1) + "   "
-            line2 += make_table_row(2) + "   "
+            line0.append("{0:2d} {1:2d} {2:2d}   ".format(d9[0], d9[1], d9[2]))
+            line1.append("{0:2d} {1:2d} {2:2d}   ".format(d9[3], d9[4], d9[5]))
+            line2.append("{0:2d} {1:2d} {2:2d}   ".format(d9[6], d9[7], d9[8]))
 
-        print(line0)
-        print(line1)
-        print(line2)
+        print("".join(line0))
+        print("".join(line1))
+        print("".join(line2))
 
         print()
 
 
-def main():
-    print("Hello traveller!")
+def _one_distance(distance: int, rng) -> dict[tuple[int, int], list[int]]:
+    """Simulates every skill level for one distance in a single batch."""
+    if np is None:
+        return {
+            (skill, distance): simulate(skill, distance)
+            for skill in range(MIN_SKILL, MAX_SKILL, SKILL_STEP)
+        }
+
+    skills = np.arange(MIN_SKILL, MAX_SKILL, SKILL_STEP)
+    ps = np.maximum(skills, 1) / 100.0
+
+    # One (skills, SAMPLES) Negative-Binomial draw covers every skill row
+    # with a single RNG call -- one variate per sample instead of one
+    # geometric variate per area.
+    pl = rng.negative_binomial(distance, ps[:, None], size=(len(skills), SAMPLES))
+    pl += distance
+
+    cells = {}
+    for i, skill in enumerate(skills):
+        histo = make_histogram(pl[i])
+        cells[(int(skill), distance)] = resample_into_d9(histo)
+    return cells
+
+
+def build_table(exact: bool = False) -> dict[tuple[int, int], list[int]]:
+    """Builds the whole table of D9s, keyed by (skill, distance)."""
+    distances = list(range(MIN_DISTANCE, MAX_DISTANCE))
+
+    # With exact we skip the simulation and compute the table from the
+    # closed-form distribution -- no sampling noise, done in milliseconds.
+    if exact:
+        return {
+            (skill, distance): exact_d9(skill, distance)
+            for distance in distances
+            for skill in range(MIN_SKILL, MAX_SKILL, SKILL_STEP)
+        }
+
+    # Each distance batch is an independent Monte-Carlo run, so we can farm
+    # them out to all cores. Each task gets its own spawned child generator;
+    # the streams stay independent even though workers inherit module state.
+    rngs = _RNG.spawn(len(distances)) if np is not None else [None] * len(distances)
+    with multiprocessing.Pool() as pool:
+        batches = pool.starmap(_one_distance, zip(distances, rngs))
 
     # D9s for the whole table.
     table = {}
-    for distance in range(MIN_DISTANCE, MAX_DISTANCE):
-        for skill in range(MIN_SKILL, MAX_SKILL, SKILL_STEP):
-            results = cruise_tests(skill, distance)
-            histo = make_histogram(results)
-            d9 = resample_into_d9(histo, distance)
-            table[(skill, distance)] = d9
-
-    print_table(table)
+    for cells in batches:
+        table.update(cells)
+    return table
+
+
+def main():
+    print("Hello traveller!")
+
+    if "--exact" in sys.argv:
+        print_table(build_table(exact=True))
+        return
+
+    # The shipped table prints instantly; the simulation only runs when it is
+    # missing. generate_table.py refreshes it.
+    try:
+        from _precomputed import TABLE
+    except ImportError:
+        TABLE = build_table()
+
+    print_table(TABLE)
 
 
 if __name__ == "__main__":